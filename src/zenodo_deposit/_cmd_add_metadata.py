@@ -0,0 +1,32 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit, _endpoint
+
+@click.command("add_metadata", help="Add metadata to an existing deposition (alias for update_metadata)")
+@click.argument("deposition_id", type=int)
+@click.option(
+    "-m",
+    "--metadata",
+    required=True,
+    help="Path to the metadata file",
+    type=click.Path(exists=True),
+)
+@click.pass_context
+def add_metadata(ctx, deposition_id, metadata):
+    """Add metadata to a Zenodo deposition by ID (uses same API as update_metadata)."""
+    import zenodo_deposit.api
+    import zenodo_deposit.metadata
+
+    logging.info("Adding metadata to deposition: %s", deposition_id)
+    base_url, token = _endpoint(ctx)
+    if not token:
+        raise click.ClickException("Access token is missing in the configuration")
+    params = {"access_token": token}
+    metadata_object = zenodo_deposit.metadata.metadata_from_toml(metadata, ctx.obj)
+    if not metadata_object.get("title"):
+        raise click.ClickException("Metadata must include a title")
+    if not metadata_object.get("creators"):
+        raise click.ClickException("Metadata must include creators")
+    results = zenodo_deposit.api.add_metadata(base_url, deposition_id, metadata_object, params)
+    logging.info("Metadata added to deposition ID: %s", deposition_id)
+    _emit(results)
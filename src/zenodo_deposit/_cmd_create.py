@@ -0,0 +1,31 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit
+
+@click.command(help="Create a new deposition, without uploading a file")
+@click.option(
+    "-m",
+    "--metadata",
+    default=None,
+    help="Path to the metadata file",
+    type=click.Path(),
+)
+@click.pass_context
+def create(ctx, metadata):
+    import zenodo_deposit.api
+    import zenodo_deposit.metadata
+
+    sandbox = ctx.obj["SANDBOX"]
+    base_url = zenodo_deposit.api.zenodo_url(sandbox)
+    if metadata:
+        metadata_object = zenodo_deposit.metadata.metadata_from_toml(metadata, ctx.obj)
+        ctx.obj["metadata"] = metadata_object
+    results = zenodo_deposit.api.create_deposition(
+        base_url,
+        {
+            "metadata": metadata_object,
+            "config": ctx.obj,
+        },
+    )
+    logging.info("Deposition created with ID: %s", results["id"])
+    _emit(results)
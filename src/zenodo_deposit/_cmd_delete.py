@@ -0,0 +1,19 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit, _endpoint
+
+@click.command(help="Delete a draft deposition")
+@click.argument("deposition_id", type=int)
+@click.pass_context
+def delete(ctx, deposition_id):
+    """Delete a Zenodo draft deposition by ID. Published depositions cannot be deleted."""
+    import zenodo_deposit.api
+
+    logging.info("Deleting deposition: %s", deposition_id)
+    base_url, token = _endpoint(ctx)
+    if not token:
+        raise click.ClickException("Access token is missing in the configuration")
+    params = {"access_token": token}
+    results = zenodo_deposit.api.delete_deposition(base_url, deposition_id, params)
+    logging.info("Deposition deleted with ID: %s", deposition_id)
+    _emit(results)
@@ -0,0 +1,61 @@
+import logging
+import click
+from itertools import chain
+import os
+from zenodo_deposit.cli import _UPLOAD_TYPE_CHOICE
+
+@click.command(help="Deposit a file")
+@click.option("--title", required=False, help="Title of the deposition")
+@click.option(
+    "--type",
+    required=False,
+    help="Upload type",
+    type=_UPLOAD_TYPE_CHOICE,
+)
+@click.option(
+    "--keywords",
+    "-k",
+    required=False,
+    help="Keyword(s) for the deposition",
+    multiple=True,
+)
+@click.option(
+    "--name",
+    required=False,
+    type=str,
+    help="Name of the depositor in last,first format",
+    default=None,
+)
+@click.option(
+    "--affiliation",
+    required=False,
+    type=str,
+    help="Affiliation of the depositor",
+    default=None,
+)
+@click.option(
+    "--metadata",
+    default=None,
+    help="Path to the metadata file",
+    type=click.Path(),
+)
+@click.argument("file", type=click.Path())
+@click.pass_context
+def deposit(ctx, file, title, type, keywords, name, affiliation, metadata):
+    import zenodo_deposit.metadata
+
+    path = os.path.abspath(file)
+    ctx.obj["title"] = title
+    ctx.obj["upload_type"] = type
+    ctx.obj["keywords"] = [
+        x.strip() for x in chain.from_iterable(k.split(",") for k in keywords)
+    ]
+    ctx.obj["name"] = name
+    ctx.obj["affiliation"] = affiliation
+    logging.info("Depositing file: %s", path)
+    logging.debug("Title: %s", title)
+    logging.debug("Type: %s", type)
+    logging.debug("Keywords: %s", keywords)
+    if metadata:
+        metadata_object = zenodo_deposit.metadata.metadata_from_toml(metadata, ctx.obj)
+        ctx.obj["metadata"] = metadata_object
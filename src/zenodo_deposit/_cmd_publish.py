@@ -0,0 +1,19 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit, _endpoint
+
+@click.command(help="Publish an existing deposition")
+@click.argument("deposition_id", type=int)
+@click.pass_context
+def publish(ctx, deposition_id):
+    """Publish a Zenodo deposition by ID."""
+    import zenodo_deposit.api
+
+    logging.info("Publishing deposition: %s", deposition_id)
+    base_url, token = _endpoint(ctx)
+    if not token:
+        raise click.ClickException("Access token is missing in the configuration")
+    params = {"access_token": token}
+    results = zenodo_deposit.api.publish_deposition(base_url, deposition_id, params)
+    logging.info("Deposition published with ID: %s", deposition_id)
+    _emit(results)
@@ -0,0 +1,15 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit
+
+@click.command(help="Retrieve deposition details")
+@click.argument("deposition_id", type=int)
+@click.pass_context
+def retrieve(ctx, deposition_id):
+    import zenodo_deposit.api
+
+    logging.info("Retrieving details for deposition: %s", deposition_id)
+    results = zenodo_deposit.api.get_deposition(
+        deposition_id, config=ctx.obj, sandbox=ctx.obj["SANDBOX"]
+    )
+    _emit(results)
@@ -0,0 +1,25 @@
+import click
+from zenodo_deposit.cli import _emit
+
+@click.command(help="Search for depositions")
+@click.option("--query", required=True, help="Search query")
+@click.option("--size", default=10, help="Number of results to return")
+@click.option("--page", default=1, help="Page number")
+@click.option("--sort", default="mostrecent", help="Sort order")
+@click.option(
+    "--status", default="all", help="Limit to depositions with a specific status"
+)
+@click.pass_context
+def search(ctx, query, size, page, sort, status):
+    import zenodo_deposit.api
+
+    results = zenodo_deposit.api.search(
+        query=query,
+        size=size,
+        page=page,
+        sort=sort,
+        status=status,
+        config=ctx.obj,
+        sandbox=ctx.obj["SANDBOX"],
+    )
+    _emit(results)
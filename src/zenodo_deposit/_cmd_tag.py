@@ -0,0 +1,30 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit, _endpoint
+
+@click.command(help="Add tags to an existing deposition")
+@click.argument("deposition_id", type=int)
+@click.option(
+    "-k",
+    "--keywords",
+    required=True,
+    multiple=True,
+    help="Keyword(s) to add to the deposition",
+)
+@click.pass_context
+def tag(ctx, deposition_id, keywords):
+    """Add tags (keywords) to a Zenodo deposition by ID."""
+    import zenodo_deposit.api
+
+    logging.info("Adding tags to deposition: %s", deposition_id)
+    base_url, token = _endpoint(ctx)
+    if not token:
+        raise click.ClickException("Access token is missing in the configuration")
+    params = {"access_token": token}
+    deposition = zenodo_deposit.api.get_deposition(deposition_id, ctx.obj, ctx.obj["SANDBOX"])
+    metadata = deposition.get("metadata", {})
+    current_keywords = metadata.get("keywords", [])
+    metadata["keywords"] = list(dict.fromkeys((*current_keywords, *keywords)))
+    results = zenodo_deposit.api.update_metadata(base_url, deposition_id, metadata, params)
+    logging.info("Tags added to deposition ID: %s", deposition_id)
+    _emit(results)
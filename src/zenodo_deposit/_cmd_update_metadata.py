@@ -0,0 +1,32 @@
+import logging
+import click
+from zenodo_deposit.cli import _emit, _endpoint
+
+@click.command("update_metadata", help="Update metadata for an existing deposition")
+@click.argument("deposition_id", type=int)
+@click.option(
+    "-m",
+    "--metadata",
+    required=True,
+    help="Path to the metadata file",
+    type=click.Path(exists=True),
+)
+@click.pass_context
+def update_metadata(ctx, deposition_id, metadata):
+    """Update metadata for a Zenodo deposition by ID."""
+    import zenodo_deposit.api
+    import zenodo_deposit.metadata
+
+    logging.info("Updating metadata for deposition: %s", deposition_id)
+    base_url, token = _endpoint(ctx)
+    if not token:
+        raise click.ClickException("Access token is missing in the configuration")
+    params = {"access_token": token}
+    metadata_object = zenodo_deposit.metadata.metadata_from_toml(metadata, ctx.obj)
+    if not metadata_object.get("title"):
+        raise click.ClickException("Metadata must include a title")
+    if not metadata_object.get("creators"):
+        raise click.ClickException("Metadata must include creators")
+    results = zenodo_deposit.api.update_metadata(base_url, deposition_id, metadata_object, params)
+    logging.info("Metadata updated for deposition ID: %s", deposition_id)
+    _emit(results)
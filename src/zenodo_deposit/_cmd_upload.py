@@ -0,0 +1,115 @@
+import logging
+import click
+from itertools import chain
+from zenodo_deposit.cli import hide_access_token, _emit, _endpoint, _UPLOAD_TYPE_CHOICE
+
+logger = logging.getLogger(__name__)
+
+@click.command(
+    help="Upload one or more files, with metadata, creating a new deposit",
+)
+@click.option("--title", required=False, help="Title of the deposition")
+@click.option("--description", required=False, help="Description of the deposition")
+@click.option(
+    "--variable",
+    "-v",
+    required=False,
+    help="Variables for metadata, format: key:value",
+    multiple=True,
+)
+@click.option(
+    "--type",
+    required=False,
+    help="Upload type",
+    type=_UPLOAD_TYPE_CHOICE,
+    default="dataset",
+)
+@click.option(
+    "--keywords",
+    "-k",
+    required=False,
+    help="Keyword(s) for the deposition",
+    multiple=True,
+)
+@click.option(
+    "--metadata",
+    "-m",
+    required=True,
+    help="Path to the metadata file",
+    type=click.Path(),
+)
+@click.option(
+    "--publish/--no-publish",
+    default=False,
+    help="Publish the deposition after uploading",
+)
+@click.option(
+    "--zip/--no-zip",
+    default=False,
+    help="Zip any directory before uploading",
+    type=bool,
+)
+@click.argument("files", type=click.Path(), nargs=-1)
+@click.pass_context
+def upload(
+    ctx, files, title, description, variable, type, keywords, metadata, publish, zip
+):
+    import zenodo_deposit.api
+    import zenodo_deposit.metadata
+
+    logger.debug("Upload command with sandbox=%s", ctx.obj["SANDBOX"])
+    ctx.obj["title"] = title
+    ctx.obj["description"] = description
+    ctx.obj["upload_type"] = type
+    ctx.obj["keywords"] = [
+        x.strip() for x in chain.from_iterable(k.split(",") for k in keywords)
+    ]
+    for var in variable:
+        key, value = var.split(":")
+        ctx.obj[key] = value
+    base_url, token = _endpoint(ctx)
+    logging.info(
+        "Uploading files: %s to %s using token %s",
+        files,
+        base_url,
+        hide_access_token(token),
+    )
+    logging.debug("Title: %s", title)
+    logging.debug("Type: %s", type)
+    logging.debug("Keywords: %s", keywords)
+    metadata_object = None
+    if metadata:
+        metadata_object = zenodo_deposit.metadata.metadata_from_toml(metadata, ctx.obj)
+    else:
+        metadata_object = {}
+
+    if title:
+        metadata_object["title"] = title
+    if description:
+        metadata_object["description"] = description
+    if type:
+        metadata_object["upload_type"] = type
+    if keywords:
+        current_keywords = metadata_object.get("keywords", [])
+        metadata_object["keywords"] = list(current_keywords) + list(keywords)
+
+    if not metadata_object.get("title"):
+        raise ValueError("Title is required")
+    if not metadata_object.get("creators"):
+        raise ValueError("Creators are required")
+    if not metadata_object.get("upload_type"):
+        raise ValueError("Upload type is required")
+    logging.debug("Metadata: %s", metadata_object)
+    results = zenodo_deposit.api.upload(
+        paths=files,
+        metadata=metadata_object,
+        config=ctx.obj,
+        sandbox=ctx.obj["SANDBOX"],
+        publish=publish,
+        zip=zip,
+    )
+    if publish:
+        logging.info("Deposition published with ID: %s", results["id"])
+    else:
+        logging.info("Deposition created with ID: %s", results["id"])
+    _emit(results)
@@ -1,9 +1,8 @@
 import tomllib as toml
+import copy
 import os
-from functools import lru_cache
 from typing import Dict
 import logging
-import copy
 
 logger = logging.getLogger(__name__)
 
@@ -12,43 +11,72 @@ default_zenodo: Dict[str, str] = {
     "ZENODO_SANDBOX_ACCESS_TOKEN": "Change me",
 }
 
+# Token values that count as unset: blank, or left at the default placeholder
+_INVALID_TOKENS: Dict[str, frozenset] = {
+    key: frozenset({"", value}) for key, value in default_zenodo.items()
+}
+
 settings_name = ".zenodo-deposit-settings.toml"
 
+# Standard config locations, in search order: current directory, then home.
+# Only the paths are fixed; which of them exists is checked on every read.
+_DEFAULT_CONFIG_PATHS = (settings_name, os.path.expanduser(f"~/{settings_name}"))
+
+# Parsed config files, keyed by (absolute path, mtime in ns)
+_PARSED: Dict[tuple, Dict] = {}
+
+# Config sections after environment overrides, keyed by (file key or None, section)
+_SECTION_CACHE: Dict[tuple, Dict[str, str]] = {}
+
 def first_file_that_exists(files):
     for file in files:
         if os.path.exists(file):
             return file
     return None
 
+def file_key(file: str) -> tuple:
+    """
+    Identify a file's current contents by (absolute path, mtime in ns).
+    The mtime is None if the file cannot be stat'ed.
+    """
+    path = os.path.abspath(file)
+    try:
+        return (path, os.stat(path).st_mtime_ns)
+    except OSError:
+        return (path, None)
+
+def load_toml(file: str) -> Dict:
+    """
+    Parse a TOML file, reusing the previous parse while the file's mtime is unchanged.
+    Returns a copy of the file's tables, so callers may modify the result.
+    """
+    key = file_key(file)
+    if key not in _PARSED:
+        with open(file, "rb") as f:
+            config = toml.load(f)
+        logger.debug("Loaded config: %s", config)
+        if key[1] is None:
+            return config
+        _PARSED[key] = config
+    return copy.deepcopy(_PARSED[key])
+
 def read_config_file(file: str = None) -> Dict[str, Dict[str, str]]:
     """
     Read the config file, if given, else look in the standard locations
     will throw an error if the config file is not found, or it is invalid TOML
     """
-    logger.debug(f"Attempting to read config file: {file if file else 'default locations'}")
+    logger.debug("Attempting to read config file: %s", file if file else "default locations")
     if file:
-        logger.info(f"Reading config file: {file}")
-        with open(file, "rb") as f:
-            config = toml.load(f)
-            logger.debug(f"Loaded config: {config}")
-            return config
+        logger.info("Reading config file: %s", file)
+        return load_toml(file)
     else:
-        first_config = first_file_that_exists(
-            [
-                settings_name,
-                os.path.expanduser(f"~/{settings_name}"),
-            ]
-        )
+        first_config = first_file_that_exists(_DEFAULT_CONFIG_PATHS)
         if first_config:
-            logger.info(f"Reading config file: {first_config}")
-            with open(first_config, "rb") as f:
-                config = toml.load(f)
-                logger.debug(f"Loaded config: {config}")
-                return config
+            logger.info("Reading config file: %s", first_config)
+            return load_toml(first_config)
     logger.debug("No config file found, using default_zenodo")
-    return {"zenodo": copy.deepcopy(default_zenodo)}
+    return {"zenodo": dict(default_zenodo)}
 
-@lru_cache(maxsize=32)
 def config_section(
     config_file=None,
     section: str = "zenodo",
@@ -56,18 +84,24 @@ def config_section(
     """
     Read a specific section from the configuration file, updating it with environment variables
     """
-    logger.debug(f"Reading section '{section}' from config file: {config_file}")
+    # Keyed on the file's mtime too, so an edited settings file is read again
+    path = config_file or first_file_that_exists(_DEFAULT_CONFIG_PATHS)
+    cache_key = (file_key(path) if path else None, section)
+    if cache_key in _SECTION_CACHE:
+        return dict(_SECTION_CACHE[cache_key])
+    logger.debug("Reading section '%s' from config file: %s", section, config_file)
     config = read_config_file(config_file)
     config_section = config.get(section)
     if not config_section:
         raise ValueError(f"Section {section} not found in the configuration file")
-    config_section = copy.deepcopy(config_section)  # Prevent modifying original
-    logger.debug(f"Config section before env update: {config_section}")
-    for key in config_section.keys():
-        if key in os.environ:
-            config_section[key] = os.environ[key]
-    logger.debug(f"Config section after env update: {config_section}")
-    return config_section
+    config_section = dict(config_section)  # Prevent modifying original
+    logger.debug("Config section before env update: %s", config_section)
+    config_section.update(
+        {key: os.environ[key] for key in config_section.keys() & os.environ.keys()}
+    )
+    logger.debug("Config section after env update: %s", config_section)
+    _SECTION_CACHE[cache_key] = config_section
+    return dict(config_section)
 
 def zenodo_config(config_file=None) -> Dict[str, str]:
     """
@@ -81,24 +115,26 @@ def validate_zenodo_config(config: Dict[str, str], use_sandbox: bool = False) ->
     Ensure that the ZENODO_ACCESS_TOKEN or ZENODO_SANDBOX_ACCESS_TOKEN is set
     to a non-empty, non-default value.
     """
-    logger.debug(f"Config module path: {__file__}")
-    logger.debug(f"Full config before validation: {config}")
-    logger.debug(f"Default zenodo config: {default_zenodo}")
+    logger.debug("Config module path: %s", __file__)
+    logger.debug("Full config before validation: %s", config)
+    logger.debug("Default zenodo config: %s", default_zenodo)
     if use_sandbox:
         token = config.get("ZENODO_SANDBOX_ACCESS_TOKEN")
-        logger.debug(f"ZENODO_SANDBOX_ACCESS_TOKEN raw: {repr(token)}")
-        logger.debug(f"ZENODO_SANDBOX_ACCESS_TOKEN length: {len(token) if token else 0}")
-        logger.debug(f"ZENODO_SANDBOX_ACCESS_TOKEN stripped: {token.strip() if token else ''}")
-        if not token or token.strip() == "" or token.strip() == default_zenodo["ZENODO_SANDBOX_ACCESS_TOKEN"]:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ZENODO_SANDBOX_ACCESS_TOKEN raw: %r", token)
+            logger.debug("ZENODO_SANDBOX_ACCESS_TOKEN length: %s", len(token) if token else 0)
+            logger.debug("ZENODO_SANDBOX_ACCESS_TOKEN stripped: %s", token.strip() if token else "")
+        if not token or token.strip() in _INVALID_TOKENS["ZENODO_SANDBOX_ACCESS_TOKEN"]:
             raise ValueError(
                 f"ZENODO_SANDBOX_ACCESS_TOKEN is not set or invalid, sandbox being used. Config: {config}"
             )
     else:
         token = config.get("ZENODO_ACCESS_TOKEN")
-        logger.debug(f"ZENODO_ACCESS_TOKEN raw: {repr(token)}")
-        logger.debug(f"ZENODO_ACCESS_TOKEN length: {len(token) if token else 0}")
-        logger.debug(f"ZENODO_ACCESS_TOKEN stripped: {token.strip() if token else ''}")
-        if not token or token.strip() == "" or token.strip() == default_zenodo["ZENODO_ACCESS_TOKEN"]:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("ZENODO_ACCESS_TOKEN raw: %r", token)
+            logger.debug("ZENODO_ACCESS_TOKEN length: %s", len(token) if token else 0)
+            logger.debug("ZENODO_ACCESS_TOKEN stripped: %s", token.strip() if token else "")
+        if not token or token.strip() in _INVALID_TOKENS["ZENODO_ACCESS_TOKEN"]:
             raise ValueError(
                 f"ZENODO_ACCESS_TOKEN is not set or invalid in production environment. Config: {config}"
             )
@@ -0,0 +1,195 @@
+import datetime
+import json
+import logging
+import sys
+import types
+import pytest
+import click
+from unittest.mock import patch
+from click.testing import CliRunner
+import zenodo_deposit.cli
+from zenodo_deposit.cli import cli, get_unique_dicts, hide_access_token, LazyGroup
+from zenodo_deposit.config import _SECTION_CACHE
+
+
+@pytest.fixture(autouse=True)
+def access_token(monkeypatch):
+    monkeypatch.setenv("ZENODO_ACCESS_TOKEN", "test_access_token_production")
+    monkeypatch.setenv("ZENODO_SANDBOX_ACCESS_TOKEN", "test_access_token_sandbox")
+    _SECTION_CACHE.clear()
+    yield
+    _SECTION_CACHE.clear()
+
+
+def make_runner(**kwargs):
+    # Keep stderr out of result.stdout. Click 8.2 always separates the two and
+    # dropped the mix_stderr argument; Click 8.1 needs it.
+    try:
+        return CliRunner(mix_stderr=False, **kwargs)
+    except TypeError:
+        return CliRunner(**kwargs)
+
+
+@pytest.fixture
+def runner():
+    return make_runner()
+
+
+def test_help_lists_every_command(runner):
+    result = runner.invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in LazyGroup.lazy_subcommands:
+        assert name in result.output
+
+
+@pytest.mark.parametrize("name", sorted(LazyGroup.lazy_subcommands))
+def test_lazy_command_loads(runner, name):
+    command = cli.get_command(click.Context(cli), name)
+    assert isinstance(command, click.Command)
+    assert command.name == name
+    result = runner.invoke(cli, [name, "--help"])
+    assert result.exit_code == 0, result.output
+    assert f"Usage: cli {name}" in result.output
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch):
+    """Let the CLI configure logging again, restoring the root level afterwards"""
+    root = logging.getLogger()
+    level = root.level
+    monkeypatch.setattr(zenodo_deposit.cli, "_log_handler", None)
+    yield root
+    root.setLevel(level)
+
+
+def test_logs_follow_stderr_across_runs(runner, fresh_logging):
+    # pytest attaches its own handlers to the root logger; start from none
+    with patch.object(fresh_logging, "handlers", []), patch(
+        "zenodo_deposit.api.get_deposition", return_value={"id": 5}
+    ):
+        for _ in range(2):
+            result = runner.invoke(cli, ["retrieve", "5"])
+            assert result.exit_code == 0
+            assert "Retrieving details for deposition: 5" in result.stderr
+        assert len(fresh_logging.handlers) == 1
+
+
+def test_logging_leaves_configured_root_alone(runner, fresh_logging):
+    existing = logging.NullHandler()
+    with patch.object(fresh_logging, "handlers", [existing]), patch(
+        "zenodo_deposit.api.get_deposition", return_value={"id": 5}
+    ):
+        result = runner.invoke(cli, ["retrieve", "5"])
+        assert result.exit_code == 0
+        assert fresh_logging.handlers == [existing]
+
+
+def test_retrieve_prints_compact_json(runner, fresh_logging):
+    deposition = {"id": 5, "metadata": {"title": "Test", "keywords": ["a", "b"]}}
+    with patch.object(fresh_logging, "handlers", []), patch(
+        "zenodo_deposit.api.get_deposition", return_value=deposition
+    ):
+        result = runner.invoke(cli, ["retrieve", "5"])
+    assert result.exit_code == 0
+    # Log lines go to stderr, leaving stdout as pure JSON
+    assert "Retrieving details for deposition: 5" in result.stderr
+    assert result.stdout == '{"id":5,"metadata":{"title":"Test","keywords":["a","b"]}}\n'
+
+
+def test_tag_keeps_existing_keywords_first(runner):
+    deposition = {"id": 5, "metadata": {"keywords": ["a", "c"]}}
+    with patch(
+        "zenodo_deposit.api.get_deposition", return_value=deposition
+    ), patch("zenodo_deposit.api.update_metadata", return_value={}) as update:
+        result = runner.invoke(cli, ["tag", "5", "-k", "b", "-k", "a", "-k", "b"])
+    assert result.exit_code == 0
+    metadata = update.call_args.args[2]
+    assert metadata["keywords"] == ["a", "c", "b"]
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("abcdefgh", "abcd****"),
+        ("abcdefghij", "abcd******"),
+        ("abcd", "abcd"),
+        ("ab", "ab"),
+        ("", ""),
+    ],
+)
+def test_hide_access_token(token, expected):
+    assert hide_access_token(token) == expected
+    assert hide_access_token(token) == expected
+
+
+@pytest.fixture
+def no_orjson(monkeypatch):
+    # A None entry makes "import orjson" raise ImportError
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+
+def test_output_keeps_non_ascii_characters(runner, no_orjson):
+    with patch("zenodo_deposit.api.get_deposition", return_value={"title": "Café"}):
+        result = runner.invoke(cli, ["retrieve", "5"])
+    assert result.exit_code == 0
+    assert result.stdout_bytes == '{"title":"Café"}\n'.encode()
+
+
+def test_output_is_utf8_on_ascii_stdout(no_orjson):
+    with patch("zenodo_deposit.api.get_deposition", return_value={"title": "Café"}):
+        result = make_runner(charset="ascii").invoke(cli, ["retrieve", "5"])
+    assert result.exit_code == 0, result.exception
+    assert result.stdout_bytes == '{"title":"Café"}\n'.encode()
+
+
+def test_output_uses_orjson_when_installed(runner, monkeypatch):
+    calls = []
+
+    def dumps(obj, option=0):
+        calls.append(obj)
+        data = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+        return data + b"\n" if option & stub.OPT_APPEND_NEWLINE else data
+
+    stub = types.SimpleNamespace(dumps=dumps, OPT_APPEND_NEWLINE=1)
+    monkeypatch.setitem(sys.modules, "orjson", stub)
+    with patch("zenodo_deposit.api.get_deposition", return_value={"title": "Café"}):
+        result = runner.invoke(cli, ["retrieve", "5"])
+    assert result.exit_code == 0
+    assert calls == [{"title": "Café"}]
+    assert result.stdout_bytes == '{"title":"Café"}\n'.encode()
+
+
+def test_endpoint_is_kept_out_of_config(runner):
+    with patch(
+        "zenodo_deposit.api.get_deposition", return_value={"metadata": {}}
+    ) as get, patch(
+        "zenodo_deposit.api.update_metadata", return_value={}
+    ) as update:
+        result = runner.invoke(cli, ["--sandbox", "tag", "5", "-k", "a"])
+    assert result.exit_code == 0
+    base_url, _, _, params = update.call_args.args
+    assert base_url == "https://sandbox.zenodo.org/api"
+    assert params == {"access_token": "test_access_token_sandbox"}
+    config = get.call_args.args[1]
+    assert "_token" not in config and "_base_url" not in config
+
+
+def test_get_unique_dicts_with_list_values():
+    dicts = [{"a": [1, 2]}, {"a": [1, 2]}, {"a": [2, 1]}]
+    assert get_unique_dicts(dicts) == [{"a": [1, 2]}, {"a": [2, 1]}]
+
+
+def test_get_unique_dicts_with_date_values():
+    day = datetime.date(2024, 1, 1)
+    dicts = [{"a": day}, {"a": day}, {"a": [day]}, {"a": [day]}]
+    assert get_unique_dicts(dicts) == [{"a": day}, {"a": [day]}]
+
+
+def test_get_unique_dicts_keeps_int_and_str_keys_apart():
+    assert get_unique_dicts([{1: "a"}, {"1": "a"}]) == [{1: "a"}, {"1": "a"}]
+
+
+def test_get_unique_dicts_with_mixed_keys_and_list_values():
+    assert get_unique_dicts([{1: [1], "a": 2}]) == [{1: [1], "a": 2}]
+    dicts = [{1: [1]}, {"1": [1]}, {1: [1]}]
+    assert get_unique_dicts(dicts) == [{1: [1]}, {"1": [1]}]
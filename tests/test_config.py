@@ -1,15 +1,23 @@
 import pytest
 import os
+import tomllib
 from unittest.mock import patch, mock_open
 from zenodo_deposit.config import (
     zenodo_config,
     config_section,
+    validate_zenodo_config,
+    default_zenodo,
+    load_toml,
+    read_config_file,
+    _PARSED,
+    _SECTION_CACHE,
 )
 
 
 @pytest.fixture(autouse=True)
 def clear_cache():
-    config_section.cache_clear()
+    _SECTION_CACHE.clear()
+    _PARSED.clear()
 
 
 def test_default_config():
@@ -58,3 +66,86 @@ def test_environment_variable():
     with patch.dict(os.environ, {"ZENODO_ACCESS_TOKEN": "env_token"}):
         result = zenodo_config()
         assert result["ZENODO_ACCESS_TOKEN"] == "env_token"
+
+
+def test_load_toml_reuses_parse_until_mtime_changes(tmp_path):
+    path = tmp_path / "settings.toml"
+    path.write_bytes(b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "first"')
+    with patch("tomllib.load", wraps=tomllib.load) as load:
+        assert load_toml(str(path))["zenodo"]["ZENODO_ACCESS_TOKEN"] == "first"
+        assert load_toml(str(path))["zenodo"]["ZENODO_ACCESS_TOKEN"] == "first"
+        assert load.call_count == 1
+        path.write_bytes(b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "second"')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+        assert load_toml(str(path))["zenodo"]["ZENODO_ACCESS_TOKEN"] == "second"
+        assert load.call_count == 2
+
+
+def test_load_toml_returns_copy(tmp_path):
+    path = tmp_path / "settings.toml"
+    path.write_bytes(b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "token"')
+    load_toml(str(path))["zenodo"]["ZENODO_ACCESS_TOKEN"] = "changed"
+    assert load_toml(str(path))["zenodo"]["ZENODO_ACCESS_TOKEN"] == "token"
+
+
+def test_load_toml_copies_nested_tables(tmp_path):
+    path = tmp_path / "settings.toml"
+    path.write_bytes(b'[zenodo.extra]\nkeywords = ["a"]')
+    load_toml(str(path))["zenodo"]["extra"]["keywords"].append("b")
+    assert load_toml(str(path))["zenodo"]["extra"]["keywords"] == ["a"]
+
+
+def test_config_section_cache_normalizes_path(tmp_path, monkeypatch):
+    (tmp_path / "settings.toml").write_bytes(b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "token"')
+    monkeypatch.chdir(tmp_path)
+    with patch("zenodo_deposit.config.read_config_file", wraps=read_config_file) as read:
+        config_section("./settings.toml")
+        config_section(str(tmp_path / "settings.toml"))
+        assert read.call_count == 1
+
+
+def test_config_section_returns_copy():
+    zenodo_config()["ZENODO_ACCESS_TOKEN"] = "changed"
+    assert zenodo_config()["ZENODO_ACCESS_TOKEN"] != "changed"
+
+
+@pytest.mark.parametrize("token", [None, "", "   ", "Change me", " Change me "])
+def test_validate_rejects_unset_tokens(token):
+    with pytest.raises(ValueError):
+        validate_zenodo_config({"ZENODO_ACCESS_TOKEN": token})
+    with pytest.raises(ValueError):
+        validate_zenodo_config({"ZENODO_SANDBOX_ACCESS_TOKEN": token}, use_sandbox=True)
+
+
+def test_validate_accepts_token():
+    assert validate_zenodo_config({"ZENODO_ACCESS_TOKEN": "real_token"})
+    assert validate_zenodo_config(
+        {"ZENODO_SANDBOX_ACCESS_TOKEN": "real_token"}, use_sandbox=True
+    )
+
+
+def test_config_section_rereads_edited_file(tmp_path):
+    path = tmp_path / "settings.toml"
+    path.write_bytes(b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "first"')
+    assert config_section(str(path))["ZENODO_ACCESS_TOKEN"] == "first"
+    path.write_bytes(b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "second"')
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+    assert config_section(str(path))["ZENODO_ACCESS_TOKEN"] == "second"
+
+
+def test_default_config_follows_working_directory(tmp_path, monkeypatch):
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (first / ".zenodo-deposit-settings.toml").write_bytes(
+        b'[zenodo]\n"ZENODO_ACCESS_TOKEN" = "first_token"'
+    )
+    monkeypatch.delenv("ZENODO_ACCESS_TOKEN", raising=False)
+    monkeypatch.setattr(
+        "zenodo_deposit.config._DEFAULT_CONFIG_PATHS",
+        (".zenodo-deposit-settings.toml", str(tmp_path / "no-home-settings.toml")),
+    )
+    monkeypatch.chdir(first)
+    assert read_config_file()["zenodo"]["ZENODO_ACCESS_TOKEN"] == "first_token"
+    monkeypatch.chdir(second)
+    assert read_config_file() == {"zenodo": default_zenodo}